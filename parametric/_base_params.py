@@ -1,4 +1,4 @@
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -8,10 +8,22 @@ import yaml
 from pydantic import BaseModel, ConfigDict, ValidationInfo, field_serializer, field_validator
 from pydantic_core import PydanticUndefined
 
+try:
+    # libyaml-backed loader/dumper are ~10x faster than the pure-Python ones
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 from parametric._context_manager import IS_FREEZE, Override
 from parametric._field_eq_check import is_equal_field
 from parametric._validate import _validate_immutable_annotation_and_coerce_np
 
+# msgpack.packb builds a fresh Packer per call; one module-level instance is reused instead
+# (Packer.pack resets its internal buffer on every call)
+_MSGPACK_PACKER = msgpack.Packer()
+
+_JSON_READY_TYPES = frozenset({int, float, bool, str, bytes, type(None)})
+
 
 class BaseParams(BaseModel):
     model_config = ConfigDict(
@@ -27,6 +39,12 @@ class BaseParams(BaseModel):
         arbitrary_types_allowed=True,
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        # warm the per-class annotation cache at class definition, off the first-validation path
+        _annotations_per_class(cls)
+
     # NOTE: args/kwargs are needed to make change on init work
     def __new__(cls, *args, **kwargs):
         if cls is BaseParams:
@@ -37,7 +55,7 @@ class BaseParams(BaseModel):
     @classmethod
     def validate_and_coerce_raw_data(cls, value: Any, val_info: ValidationInfo) -> Any:
         res = _validate_immutable_annotation_and_coerce_np(
-            val_info.field_name, cls.model_fields[val_info.field_name].annotation, value
+            val_info.field_name, _annotations_per_class(cls)[val_info.field_name], value
         )
         if res is None:
             return value
@@ -52,13 +70,19 @@ class BaseParams(BaseModel):
                 self._override_for_loop(data)
 
     def _override_for_loop(self, data):
+        # toggle the freeze state once for the whole batch; assigning through
+        # BaseModel.__setattr__ directly skips the recursive freeze walk per key
+        self._set_freeze(IS_FREEZE.res)
         for k, v in data.items():
             # NOTE: this also validates
-            setattr(self, k, v)
+            BaseModel.__setattr__(self, k, v)
 
     # ==== serializing
     @field_serializer("*", when_used="json")
     def _serialize_helper(self, value: Any) -> Any:
+        # fast path: most fields are plain scalars that need no conversion
+        if type(value) in _JSON_READY_TYPES:
+            return value
         # === path to str
         if isinstance(value, Path):
             return str(value.as_posix())
@@ -71,20 +95,21 @@ class BaseParams(BaseModel):
         return value
 
     def model_dump_serializable(self) -> dict[str, Any]:
-        return json.loads(self.model_dump_json())
+        # NOTE: mode="json" walks the model once into builtin containers, no JSON text round-trip
+        return self.model_dump(mode="json")
 
     def model_dump_non_defaults(self) -> dict[str, Any]:
         changed = {}
 
         # NOTE: first we must find all undefined and overrid them in the default params instance
         undefined_override_dict = {}
-        for field_name, field_info in self.model_fields.items():
+        for field_name, field_info in type(self).model_fields.items():
             default_value_not_validated = field_info.get_default()
             if default_value_not_validated is PydanticUndefined:
                 undefined_override_dict[field_name] = getattr(self, field_name)
 
         default_params = self.__class__(**undefined_override_dict)
-        for field_name in self.model_fields:
+        for field_name in _annotations_per_class(type(self)):
             current_value = getattr(self, field_name)
             if field_name in undefined_override_dict:
                 changed[field_name] = current_value
@@ -104,27 +129,23 @@ class BaseParams(BaseModel):
     # ====== msgpack
     def save_msgpack(self, save_path: str | Path) -> None:
         with open(save_path, "wb") as file:
-            file.write(msgpack.packb(self.model_dump_serializable()))
+            file.write(_MSGPACK_PACKER.pack(self.model_dump_serializable()))
 
     def override_from_msgpack_path(self, msgpack_path: Path | str) -> None:
-        _validate_filepath(msgpack_path)
-
-        with open(msgpack_path, "rb") as file:
+        with _open_validated_file(msgpack_path, "rb") as file:
             msgpack_data = msgpack.unpackb(file.read())
         self.override_from_dict(msgpack_data)
 
     @classmethod
     def load_from_msgpack_path(cls, msgpack_path: Path | str):
-        _validate_filepath(msgpack_path)
-
-        with open(msgpack_path, "rb") as file:
+        with _open_validated_file(msgpack_path, "rb") as file:
             msgpack_data = msgpack.unpackb(file.read())
         return cls(**msgpack_data)
 
     # ====== yaml
     def save_yaml(self, save_path: str | Path) -> None:
         with open(save_path, "w") as file:
-            yaml.dump(self.model_dump_serializable(), file)
+            yaml.dump(self.model_dump_serializable(), file, Dumper=_YamlDumper)
 
     def override_from_yaml_path(self, yaml_path: Path | str) -> None:
         yaml_data = _open_yaml_file(yaml_path)
@@ -140,41 +161,60 @@ class BaseParams(BaseModel):
     def __eq__(self, other: "BaseParams") -> bool:
         if not isinstance(other, BaseParams):
             return False
-        for field_name in self.model_fields:
-            if field_name not in other.model_fields:
+        # field values live in __dict__ in pydantic v2; indexing it avoids one getattr
+        # descriptor lookup per field per side
+        self_values = self.__dict__
+        other_values = other.__dict__
+        for field_name in _annotations_per_class(type(self)):
+            if field_name not in other_values:
                 return False
-            if not is_equal_field(getattr(self, field_name), getattr(other, field_name)):
+            if not is_equal_field(self_values[field_name], other_values[field_name]):
                 return False
         return True
 
     # ==== setter with freeze check
     def __setattr__(self, name, value):
-        self._set_freeze(IS_FREEZE.res)
+        is_frozen = IS_FREEZE.res
+        # fast path: already frozen and staying frozen, so there is nothing to toggle before
+        # pydantic rejects the assignment. The unfrozen direction keeps the walk because it is
+        # what makes np arrays writeable again inside an Override context
+        if is_frozen and self.model_config["frozen"]:
+            return super().__setattr__(name, value)
+        self._set_freeze(is_frozen)
         return super().__setattr__(name, value)
 
     def _set_freeze(self, is_frozen: bool):
-        for field_name in self.model_fields:
-            var = getattr(self, field_name)
+        # read field values straight from __dict__ to skip pydantic's per-field getattr machinery
+        for var in self.__dict__.values():
             if isinstance(var, BaseParams):
                 var._set_freeze(is_frozen)
             elif isinstance(var, np.ndarray):
-                var.flags.writeable = not is_frozen
+                try:
+                    var.flags.writeable = not is_frozen
+                except ValueError:
+                    # the array wraps a buffer that arrived read-only; it stays read-only
+                    pass
         self.model_config["frozen"] = is_frozen
 
 
-def _open_yaml_file(yaml_path: Path | str) -> dict[str, Any]:
-    _validate_filepath(yaml_path)
+@lru_cache(maxsize=None)
+def _annotations_per_class(cls: type) -> dict[str, Any]:
+    # field annotations are static after class creation, so one walk per subclass is enough
+    return {field_name: field_info.annotation for field_name, field_info in cls.model_fields.items()}
+
 
-    with open(yaml_path, "r") as file:
-        yaml_data = yaml.safe_load(file)
+def _open_yaml_file(yaml_path: Path | str) -> dict[str, Any]:
+    with _open_validated_file(yaml_path, "r") as file:
+        yaml_data = yaml.load(file, Loader=_YamlLoader)
     # None returns if file is empty
     if yaml_data is None:
         yaml_data = {}
     return yaml_data
 
 
-def _validate_filepath(filepath: Path | str) -> Path:
-    filepath = Path(filepath)
-    if not filepath.is_file():
-        raise FileNotFoundError(f"No such file: '{filepath}'")
-    return filepath
+def _open_validated_file(filepath: Path | str, mode: str):
+    # opening directly saves the extra stat() of an is_file() pre-check (and its TOCTOU race)
+    try:
+        return open(filepath, mode)
+    except (FileNotFoundError, IsADirectoryError):
+        raise FileNotFoundError(f"No such file: '{filepath}'") from None
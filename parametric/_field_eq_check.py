@@ -3,8 +3,17 @@ from typing import Any
 
 import numpy as np
 
+_FAST_SCALAR_TYPES = frozenset({int, float, bool, str, bytes})
+
 
 def is_equal_field(val1: Any, val2: Any) -> bool:
+    # identical objects are equal by definition - a single pointer compare
+    if val1 is val2:
+        return True
+    # exact-type scalars skip the isinstance chain below
+    val1_type = type(val1)
+    if val1_type is type(val2) and val1_type in _FAST_SCALAR_TYPES:
+        return val1 == val2
     # for enums
     if isinstance(val1, enum.Enum) and isinstance(val2, enum.Enum):
         return val1.value == val2.value
@@ -1,15 +1,38 @@
 import enum
 from collections import deque
 from pathlib import Path
-from types import GeneratorType, UnionType
-from typing import Any, Literal, Type, Union, get_origin
+from types import GeneratorType, GenericAlias, UnionType
+from typing import Any, Literal, Type, Union, get_args, get_origin
 
 import numpy as np
-from typing_extensions import get_args
+
+_ENUM_META = enum.EnumMeta
+
+_IMMUTABLE_BASE_TYPES = frozenset({int, float, bool, str, bytes, Path, type(None)})
+
+_TUPLE_COMPATIBLE_TYPES = (list, tuple, set, frozenset, GeneratorType, deque)
+
+# annotations that already validated once and never inspect or coerce the value
+# (basic types, enums, BaseParams subclasses, Literal)
+_PASSTHROUGH_ANNOTATIONS: set = set()
+
+# unions that already passed one full validation of all their members
+_VALIDATED_UNIONS: set = set()
+# subset of _VALIDATED_UNIONS whose members never coerce values (no np.ndarray/tuple inside)
+_VALUE_INDEPENDENT_UNIONS: set = set()
+
+# id(annotation) -> (annotation, outer_type, inner_types); the annotation itself is stored to keep
+# it alive so its id cannot be reused. Size-gated in case of many transient annotations.
+_INSPECT_CACHE: dict[int, tuple] = {}
+_INSPECT_CACHE_MAX_SIZE = 10_000
 
 
 def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, value: Any) -> None:
-    if annotation == Any:
+    # fast path: this annotation is known to pass any value through untouched
+    if annotation in _PASSTHROUGH_ANNOTATIONS:
+        return
+
+    if annotation is Any:
         raise ValueError(f"Type `Any` is not allowed, cannot convert '{name}'")
 
     if annotation is Ellipsis:
@@ -18,26 +41,34 @@ def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, va
         )
 
     # ==== basic types
-    if annotation in {int, float, bool, str, bytes, Path, type(None)}:
+    if annotation in _IMMUTABLE_BASE_TYPES:
+        _PASSTHROUGH_ANNOTATIONS.add(annotation)
         return
 
     # == enums
-    if isinstance(annotation, enum.EnumMeta):
+    # NOTE: the `type(...) is` check is a single pointer compare; isinstance is only needed for
+    # user metaclasses that further subclass EnumMeta
+    if type(annotation) is _ENUM_META or isinstance(annotation, _ENUM_META):
+        _PASSTHROUGH_ANNOTATIONS.add(annotation)
         return
 
     # ==== BaseParams
     # NOTE: This import is here to avoid circular imports
     from parametric import BaseParams
 
-    try:
-        if issubclass(annotation, BaseParams):
-            return
-    except Exception:
-        pass
+    if isinstance(annotation, type) and not isinstance(annotation, GenericAlias) and issubclass(annotation, BaseParams):
+        _PASSTHROUGH_ANNOTATIONS.add(annotation)
+        return
 
     # ==== complex types
-    outer_type = get_origin(annotation)
-    inner_types = get_args(annotation)
+    cached = _INSPECT_CACHE.get(id(annotation))
+    if cached is None:
+        outer_type = get_origin(annotation)
+        inner_types = get_args(annotation)
+        if len(_INSPECT_CACHE) < _INSPECT_CACHE_MAX_SIZE:
+            _INSPECT_CACHE[id(annotation)] = (annotation, outer_type, inner_types)
+    else:
+        _, outer_type, inner_types = cached
 
     # ===== old types are bad
     try:
@@ -66,26 +97,39 @@ def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, va
         _validate_immutable_annotation_and_coerce_np(name, arr_dtype, value)
         if arr_dtype is type(None):
             raise ValueError(f"dtype of 'np.ndarray' {name} cannot be NoneType")
-        if get_origin(arr_dtype) in {UnionType, tuple}:
+        arr_dtype_origin = get_origin(arr_dtype)
+        if arr_dtype_origin is UnionType or arr_dtype_origin is tuple:
             raise ValueError(f"dtype of 'np.ndarray' {name} cannot be Union or Tuple")
 
-        arr = np.array(value, dtype=inner_types[0])
+        arr = np.asarray(value, dtype=arr_dtype)
+        if arr is value and arr.flags.writeable:
+            # already the right dtype: freeze a view instead of copying the whole buffer
+            arr = arr.view()
         arr.flags.writeable = False
         return arr
 
     # == union
     if outer_type is UnionType:
+        # fast path: this union was already fully validated and no member can coerce any value
+        if annotation in _VALUE_INDEPENDENT_UNIONS:
+            return None
+
+        # fast path for the dominant `x | None` shape: None needs no coercion, and the np/tuple
+        # members must not try to consume it. Only unions whose members already validated once
+        # are eligible, so bad annotations still raise on first use
+        if value is None and annotation in _VALIDATED_UNIONS and type(None) in inner_types:
+            return None
+
+        # single pass: validate each member and check for union of common types at the same time
         res_to_return = None
+        is_basic_type_already_exist = False
+        is_np_exist = False
+        is_tuple_exist = False
         for arg in inner_types:
             tmp_res = _validate_immutable_annotation_and_coerce_np(name, arg, value)
             if res_to_return is None:
                 res_to_return = tmp_res
 
-        # type checks passed, now check for union of common types
-        is_basic_type_already_exist = False
-        is_np_exist = False
-        is_tuple_exist = False
-        for arg in inner_types:
             outer_arg = get_origin(arg)
             if outer_arg is np.ndarray:
                 is_np_exist = True
@@ -93,20 +137,24 @@ def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, va
                     raise ValueError(
                         "Union of numpy and tuple is bad practice since their serialization can be similar"
                     )
-            if outer_arg is tuple:
+            elif outer_arg is tuple:
                 is_tuple_exist = True
                 if is_np_exist:
                     raise ValueError(
                         "Union of numpy and tuple is bad practice since their serialization can be similar"
                     )
 
-            if arg in {type(None), tuple}:
+            if arg is type(None) or arg is tuple:
                 continue
             if is_basic_type_already_exist:
                 raise ValueError(
                     "Union of common types is bad practice. You can use None and tuple and ONE other type in unions"
                 )
             is_basic_type_already_exist = True
+
+        _VALIDATED_UNIONS.add(annotation)
+        if not is_np_exist and not is_tuple_exist:
+            _VALUE_INDEPENDENT_UNIONS.add(annotation)
         return res_to_return
 
     # == tuple
@@ -114,8 +162,12 @@ def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, va
         raise ValueError(f"Type of {name} cannot be 'tuple' without specifying element types (e.g. tuple[int, str])")
 
     if outer_type is tuple:
-        if not isinstance(value, (list, tuple, set, frozenset, GeneratorType, deque)):
-            raise ValueError(f"In {name}, {type(value)} is not tuple compatible.")
+        value_type = type(value)
+        if value_type is not list and value_type is not tuple:
+            if not isinstance(value, _TUPLE_COMPATIBLE_TYPES):
+                raise ValueError(f"In {name}, {type(value)} is not tuple compatible.")
+            # materialize once so the value can be length-checked and sliced below
+            value = tuple(value)
 
         is_end_with_elipsis = False
         if inner_types[-1] is Ellipsis:
@@ -125,24 +177,34 @@ def _validate_immutable_annotation_and_coerce_np(name: str, annotation: Type, va
         elif len(inner_types) != len(value):
             raise ValueError(f"Expected in {name} a tuple of length {len(inner_types)}, got {len(value)}")
 
-        res = []
-        is_np_inside = False
+        # fast path: fixed-arity tuple whose elements already exactly match basic inner types
+        if not is_end_with_elipsis and type(value) is tuple:
+            for val_i, inner_t in zip(value, inner_types):
+                if inner_t not in _IMMUTABLE_BASE_TYPES or type(val_i) is not inner_t:
+                    break
+            else:
+                return None
+
+        # NOTE: res stays None (no list allocation) as long as no element was coerced
+        res = None
         for i, val_i in enumerate(value):
             curr_inner_type = inner_types[0] if is_end_with_elipsis else inner_types[i]
             arg_res = _validate_immutable_annotation_and_coerce_np(name, curr_inner_type, val_i)
 
             if arg_res is not None:
+                if res is None:
+                    res = list(value[:i])
                 res.append(arg_res)
-                is_np_inside = True
-            else:
+            elif res is not None:
                 res.append(val_i)
 
-        if is_np_inside:
+        if res is not None:
             return tuple(res)
         return None
 
     # == Literal
     if outer_type is Literal:
+        _PASSTHROUGH_ANNOTATIONS.add(annotation)
         return
 
     # ==== Raise error if the type is not handled